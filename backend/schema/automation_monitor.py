@@ -10,13 +10,22 @@ import os
 import sys
 import json
 import sqlite3
+import selectors
 import subprocess
 import argparse
 import logging
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # optional: faster metadata parsing
+    orjson = None
 
 # Colors for terminal output
 class Colors:
@@ -30,6 +39,11 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# Plain output when piped or redirected (logs, cron mail)
+if not sys.stdout.isatty():
+    for _name in [name for name in vars(Colors) if name.isupper()]:
+        setattr(Colors, _name, "")
+
 def print_header(text: str) -> None:
     """Print colored header text"""
     print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*60}{Colors.ENDC}")
@@ -52,6 +66,172 @@ def print_info(text: str) -> None:
     """Print info message"""
     print(f"{Colors.OKBLUE}[INFO]{Colors.ENDC} {text}")
 
+# Counts and date range in a single table scan
+TICK_STATS_SQL = """
+    SELECT
+        COUNT(*),
+        COUNT(DISTINCT symbol),
+        datetime(MIN(timestamp) / 1000, 'unixepoch') as first,
+        datetime(MAX(timestamp) / 1000, 'unixepoch') as last
+    FROM ticks;
+"""
+
+RETENTION_POLICY = f"""\
+{Colors.BOLD}Daily Rotation:{Colors.ENDC}
+  • Time: Midnight UTC (00:00)
+  • Action: Create new database for current day
+  • Previous day: Closed and backed up
+
+{Colors.BOLD}Weekly Compression:{Colors.ENDC}
+  • Time: Sunday 02:00 UTC
+  • Threshold: Databases older than 7 days
+  • Method: zstd compression level 19
+  • Compression ratio: Typically 4-5x
+
+{Colors.BOLD}Monthly Archival:{Colors.ENDC}
+  • Time: 1st of month at 03:00 UTC
+  • Threshold: Databases older than 30 days
+  • Action: Archive to cold storage
+
+{Colors.BOLD}Retention Timeline:{Colors.ENDC}
+  • 0-7 days:   Active (uncompressed) - Hot tier
+  • 7-30 days:  Compressed - Warm tier
+  • 30-180 days: Archived - Cold tier
+  • 180+ days:  Deleted
+"""
+
+@lru_cache(maxsize=8)
+def _load_metadata(path: str, mtime_ns: int) -> Dict:
+    """Parse a metadata file; mtime_ns is part of the cache key so edits are picked up"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def _scan(db_dir: Path) -> Iterator[Tuple[str, str, os.stat_result]]:
+    """Walk db_dir/<year>/<month>/ and yield (name, path, stat) for each file"""
+    with os.scandir(db_dir) as years:
+        for year in years:
+            if not year.is_dir():
+                continue
+            with os.scandir(year.path) as months:
+                for month in months:
+                    if not month.is_dir():
+                        continue
+                    with os.scandir(month.path) as entries:
+                        for entry in entries:
+                            if entry.is_file():
+                                yield entry.name, entry.path, entry.stat()
+
+def _list_names(directory: Path) -> Optional[set]:
+    """Return the entry names of a directory, or None if it is missing"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+def _disk_usage(path: Path) -> Tuple[int, int]:
+    """Return (total, used) bytes for the filesystem containing path"""
+    if hasattr(os, "statvfs"):
+        st = os.statvfs(path)
+        return st.f_blocks * st.f_frsize, (st.f_blocks - st.f_bfree) * st.f_frsize
+    usage = shutil.disk_usage(path)
+    return usage.total, usage.used
+
+def _stream_command(cmd: List[str], env: Optional[Dict[str, str]] = None) -> int:
+    """Run a command, echoing its stdout/stderr as it arrives; return the exit code"""
+    sys.stdout.flush()
+    if os.name == "nt":
+        # selectors cannot wait on pipes on Windows, so merge stderr into stdout
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=1, text=True, env=env)
+        for line in proc.stdout:
+            sys.stdout.write(line)
+        return proc.wait()
+
+    # Unbuffered pipes + os.read so select() never misses data held in a Python buffer
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=0, env=env)
+    with selectors.DefaultSelector() as sel:
+        sel.register(proc.stdout, selectors.EVENT_READ, sys.stdout)
+        sel.register(proc.stderr, selectors.EVENT_READ, sys.stderr)
+        while sel.get_map():
+            for key, _ in sel.select():
+                chunk = os.read(key.fd, 65536)
+                if not chunk:
+                    sel.unregister(key.fileobj)
+                    key.fileobj.close()
+                    continue
+                key.data.buffer.write(chunk)
+                key.data.flush()
+    return proc.wait()
+
+def _readonly_uri(db_file: Path) -> str:
+    """Build a read-only SQLite URI for a database file"""
+    # Not immutable=1: tick DBs use WAL, and immutable ignores committed rows still in -wal
+    return f"{db_file.resolve().as_uri()}?mode=ro"
+
+def _connect_readonly(db_file: Path) -> sqlite3.Connection:
+    """Open a read-only connection tuned for full-table scans"""
+    conn = sqlite3.connect(_readonly_uri(db_file), uri=True, check_same_thread=False)
+    conn.execute("PRAGMA mmap_size=268435456;")
+    conn.execute("PRAGMA cache_size=-65536;")
+    return conn
+
+def _run_readonly_query(db_file: Path, sql: str) -> List[Tuple]:
+    """Run a single query on its own read-only connection"""
+    conn = _connect_readonly(db_file)
+    try:
+        return conn.execute(sql).fetchall()
+    finally:
+        conn.close()
+
+def _count_ticks(db_paths: List[str]) -> List[Optional[int]]:
+    """Count ticks per database through one connection, ATTACHing in batches"""
+    counts: List[Optional[int]] = []
+    conn = sqlite3.connect(":memory:", uri=True)
+    try:
+        # SQLITE_LIMIT_ATTACHED is a compile-time ceiling (10 by default)
+        batch_size = conn.getlimit(sqlite3.SQLITE_LIMIT_ATTACHED) if hasattr(conn, "getlimit") else 10
+        for start in range(0, len(db_paths), batch_size):
+            batch = db_paths[start:start + batch_size]
+            batch_counts: List[Optional[int]] = [None] * len(batch)
+            attached: List[int] = []
+            try:
+                for i, db_path in enumerate(batch):
+                    try:
+                        conn.execute(f"ATTACH DATABASE ? AS d{i}", (_readonly_uri(Path(db_path)),))
+                        attached.append(i)
+                    except sqlite3.Error as e:
+                        print_warning(f"Failed to count ticks in {db_path}: {e}")
+                if attached:
+                    sql = " UNION ALL ".join(f"SELECT {i}, COUNT(*) FROM d{i}.ticks" for i in attached)
+                    try:
+                        for i, count in conn.execute(sql).fetchall():
+                            batch_counts[i] = count
+                    except sqlite3.Error:
+                        # One unreadable DB fails the whole UNION; retry each on its own
+                        for i in attached:
+                            try:
+                                batch_counts[i] = conn.execute(f"SELECT COUNT(*) FROM d{i}.ticks").fetchone()[0]
+                            except sqlite3.Error as e:
+                                print_warning(f"Failed to count ticks in {batch[i]}: {e}")
+            finally:
+                for i in attached:
+                    conn.execute(f"DETACH DATABASE d{i}")
+            counts.extend(batch_counts)
+    finally:
+        conn.close()
+    return counts
+
+def _has_symbol_index(cursor: sqlite3.Cursor) -> bool:
+    """Check whether ticks has an index whose leading column is symbol"""
+    cursor.execute("""
+        SELECT 1
+        FROM pragma_index_list('ticks') AS il, pragma_index_info(il.name) AS ii
+        WHERE ii.seqno = 0 AND ii.name = 'symbol'
+        LIMIT 1;
+    """)
+    return cursor.fetchone() is not None
+
 class DatabaseRotationMonitor:
     """Monitor database rotation and compression automation"""
 
@@ -60,8 +240,11 @@ class DatabaseRotationMonitor:
         self.project_path = Path(project_path)
         self.db_dir = Path(db_dir) if db_dir else self.project_path / "data" / "ticks" / "db"
         self.schema_dir = self.project_path / "backend" / "schema"
-        self.log_dir = Path("/var/log/trading-engine") if os.name != "nt" else self.project_path / "logs"
+        self.is_nt = os.name == "nt"
+        self.log_dir = Path("/var/log/trading-engine") if not self.is_nt else self.project_path / "logs"
         self.metadata_file = self.db_dir / "rotation_metadata.json"
+        self.rotate_script = self.schema_dir / ("rotate_tick_db.ps1" if self.is_nt else "rotate_tick_db.sh")
+        self.compress_script = self.schema_dir / "compress_old_dbs.sh"
 
     def check_system_status(self) -> bool:
         """Check if automation is properly set up"""
@@ -70,26 +253,29 @@ class DatabaseRotationMonitor:
         checks_passed = 0
         checks_total = 0
 
+        # One directory read per location instead of a stat per path
+        schema_names = _list_names(self.schema_dir) or set()
+        db_names = _list_names(self.db_dir)
+        db_dir_exists = db_names is not None
+        db_names = db_names or set()
+
         # Check 1: Script files exist
         checks_total += 1
-        rotate_script = self.schema_dir / ("rotate_tick_db.ps1" if os.name == "nt" else "rotate_tick_db.sh")
-        compress_script = self.schema_dir / "compress_old_dbs.sh"
-
-        if rotate_script.exists():
-            print_success(f"Rotation script exists: {rotate_script}")
+        if self.rotate_script.name in schema_names:
+            print_success(f"Rotation script exists: {self.rotate_script}")
             checks_passed += 1
         else:
-            print_error(f"Rotation script missing: {rotate_script}")
+            print_error(f"Rotation script missing: {self.rotate_script}")
 
-        if compress_script.exists():
-            print_success(f"Compression script exists: {compress_script}")
+        if self.compress_script.name in schema_names:
+            print_success(f"Compression script exists: {self.compress_script}")
             checks_passed += 1
         else:
-            print_error(f"Compression script missing: {compress_script}")
+            print_error(f"Compression script missing: {self.compress_script}")
 
         # Check 2: DB directory exists
         checks_total += 1
-        if self.db_dir.exists():
+        if db_dir_exists:
             print_success(f"Database directory exists: {self.db_dir}")
             checks_passed += 1
         else:
@@ -97,7 +283,7 @@ class DatabaseRotationMonitor:
 
         # Check 3: Metadata file
         checks_total += 1
-        if self.metadata_file.exists():
+        if self.metadata_file.name in db_names:
             print_success(f"Rotation metadata found: {self.metadata_file}")
             checks_passed += 1
         else:
@@ -105,13 +291,14 @@ class DatabaseRotationMonitor:
 
         # Check 4: Cron/Task Scheduler
         checks_total += 1
-        if os.name == "nt":
+        if self.is_nt:
+            # schtasks.exe /TN does not accept wildcards, so list all tasks as CSV
             result = subprocess.run(
-                ["powershell.exe", "-Command", "Get-ScheduledTask | Where-Object {$_.TaskName -like '*Trading-Engine-DB*'} | Measure-Object | Select-Object -ExpandProperty Count"],
+                ["schtasks.exe", "/Query", "/FO", "CSV", "/NH"],
                 capture_output=True,
                 text=True
             )
-            if result.returncode == 0 and result.stdout.strip() and int(result.stdout.strip()) > 0:
+            if result.returncode == 0 and "Trading-Engine-DB" in result.stdout:
                 print_success("Windows Task Scheduler tasks found")
                 checks_passed += 1
             else:
@@ -119,7 +306,7 @@ class DatabaseRotationMonitor:
         else:
             result = subprocess.run(
                 ["crontab", "-l"],
-                capture_output=True,
+                stdout=subprocess.PIPE,
                 text=True,
                 stderr=subprocess.DEVNULL
             )
@@ -131,11 +318,11 @@ class DatabaseRotationMonitor:
 
         # Check 5: Disk space
         checks_total += 1
-        if self.db_dir.exists():
-            stat = shutil.disk_usage(self.db_dir)
-            usage_percent = (stat.used / stat.total) * 100
+        if db_dir_exists:
+            total, used = _disk_usage(self.db_dir)
+            usage_percent = (used / total) * 100
             if usage_percent < 80:
-                print_success(f"Disk usage: {usage_percent:.1f}% ({stat.used / (1024**3):.1f}GB / {stat.total / (1024**3):.1f}GB)")
+                print_success(f"Disk usage: {usage_percent:.1f}% ({used / (1024**3):.1f}GB / {total / (1024**3):.1f}GB)")
                 checks_passed += 1
             else:
                 print_error(f"Disk usage high: {usage_percent:.1f}% - Consider archiving old databases")
@@ -143,8 +330,8 @@ class DatabaseRotationMonitor:
         print(f"\n{Colors.BOLD}Summary: {checks_passed}/{checks_total} checks passed{Colors.ENDC}")
         return checks_passed == checks_total
 
-    def get_database_inventory(self) -> Dict:
-        """Get inventory of all databases"""
+    def get_database_inventory(self, counts: bool = False) -> Dict:
+        """Get inventory of all databases (per-DB tick counts only when counts)"""
         print_header("Database Inventory")
 
         inventory = {
@@ -158,9 +345,16 @@ class DatabaseRotationMonitor:
             print_warning(f"Database directory does not exist: {self.db_dir}")
             return inventory
 
-        # Find all databases
-        active_dbs = sorted(self.db_dir.glob("*/*/*.db"))
-        compressed_dbs = sorted(self.db_dir.glob("*/*/*.db.zst"))
+        # Find all databases (single walk, stat results cached per entry)
+        active_dbs = []
+        compressed_dbs = []
+        for name, path, st in _scan(self.db_dir):
+            if name.endswith(".db.zst"):
+                compressed_dbs.append((name, path, st))
+            elif name.endswith(".db"):
+                active_dbs.append((name, path, st))
+        active_dbs.sort(key=lambda item: item[0])
+        compressed_dbs.sort(key=lambda item: item[0])
 
         print_info(f"Active databases: {len(active_dbs)}")
         print_info(f"Compressed databases: {len(compressed_dbs)}")
@@ -169,30 +363,39 @@ class DatabaseRotationMonitor:
         # Analyze active databases
         if active_dbs:
             print(f"{Colors.OKBLUE}Active Databases (last 10):{Colors.ENDC}")
-            for db_file in active_dbs[-10:]:
-                size_mb = db_file.stat().st_size / (1024 * 1024)
-                mod_time = datetime.fromtimestamp(db_file.stat().st_mtime)
-                inventory["active"].append({
-                    "path": str(db_file),
+            recent_dbs = active_dbs[-10:]
+            # COUNT(*) scans each table, so only pay for it when asked
+            tick_counts = _count_ticks([path for _, path, _ in recent_dbs]) if counts else [None] * len(recent_dbs)
+            for (name, path, st), tick_count in zip(recent_dbs, tick_counts):
+                size_mb = st.st_size / (1024 * 1024)
+                mod_time = datetime.fromtimestamp(st.st_mtime)
+                entry = {
+                    "path": path,
                     "size_mb": size_mb,
                     "mtime": mod_time.isoformat()
-                })
-                inventory["total_size_bytes"] += db_file.stat().st_size
-                print(f"  {db_file.name:30} {size_mb:8.2f} MB  {mod_time.strftime('%Y-%m-%d %H:%M:%S')}")
+                }
+                line = f"  {name:30} {size_mb:8.2f} MB  {mod_time.strftime('%Y-%m-%d %H:%M:%S')}"
+                if counts:
+                    entry["tick_count"] = tick_count
+                    ticks_label = f"{tick_count:,}" if tick_count is not None else "n/a"
+                    line += f"  {ticks_label:>12} ticks"
+                inventory["active"].append(entry)
+                inventory["total_size_bytes"] += st.st_size
+                print(line)
 
         # Analyze compressed databases
         if compressed_dbs:
             print(f"\n{Colors.OKBLUE}Compressed Databases (last 10):{Colors.ENDC}")
-            for db_file in compressed_dbs[-10:]:
-                size_mb = db_file.stat().st_size / (1024 * 1024)
-                mod_time = datetime.fromtimestamp(db_file.stat().st_mtime)
+            for name, path, st in compressed_dbs[-10:]:
+                size_mb = st.st_size / (1024 * 1024)
+                mod_time = datetime.fromtimestamp(st.st_mtime)
                 inventory["compressed"].append({
-                    "path": str(db_file),
+                    "path": path,
                     "size_mb": size_mb,
                     "mtime": mod_time.isoformat()
                 })
-                inventory["compressed_size_bytes"] += db_file.stat().st_size
-                print(f"  {db_file.name:30} {size_mb:8.2f} MB  {mod_time.strftime('%Y-%m-%d %H:%M:%S')}")
+                inventory["compressed_size_bytes"] += st.st_size
+                print(f"  {name:30} {size_mb:8.2f} MB  {mod_time.strftime('%Y-%m-%d %H:%M:%S')}")
 
         # Summary
         print()
@@ -207,12 +410,13 @@ class DatabaseRotationMonitor:
 
     def get_rotation_metadata(self) -> Optional[Dict]:
         """Get rotation metadata"""
-        if not self.metadata_file.exists():
+        try:
+            mtime_ns = os.stat(self.metadata_file).st_mtime_ns
+        except FileNotFoundError:
             return None
 
         try:
-            with open(self.metadata_file, 'r') as f:
-                return json.load(f)
+            return _load_metadata(str(self.metadata_file), mtime_ns)
         except Exception as e:
             print_error(f"Failed to read metadata: {e}")
             return None
@@ -230,8 +434,8 @@ class DatabaseRotationMonitor:
         else:
             print_warning("No rotation metadata found - rotation may not have run yet")
 
-    def analyze_database(self, db_path: str) -> Dict:
-        """Analyze a specific database"""
+    def analyze_database(self, db_path: str, deep: bool = False) -> Dict:
+        """Analyze a specific database (full integrity_check only when deep)"""
         print_header(f"Database Analysis: {db_path}")
 
         analysis = {
@@ -251,43 +455,47 @@ class DatabaseRotationMonitor:
         print_info(f"File size: {analysis['size_mb']:.2f} MB")
 
         try:
-            conn = sqlite3.connect(db_path)
+            conn = _connect_readonly(db_file)
             cursor = conn.cursor()
 
-            # Check integrity
-            cursor.execute("PRAGMA integrity_check;")
-            integrity = cursor.fetchone()[0]
+            # Get symbols (only 10 are shown, the 11th tells us to print "...")
+            if _has_symbol_index(cursor):
+                symbols_sql = "SELECT symbol FROM ticks GROUP BY symbol ORDER BY symbol LIMIT 11;"
+            else:
+                symbols_sql = "SELECT DISTINCT symbol FROM ticks ORDER BY symbol LIMIT 11;"
+
+            queries = {
+                # quick_check skips the index/content cross-checks of integrity_check
+                "integrity": "PRAGMA integrity_check;" if deep else "PRAGMA quick_check;",
+                "stats": TICK_STATS_SQL,
+                "symbols": symbols_sql,
+            }
+            if deep:
+                # Full scans are I/O bound, so keep them in flight on separate readers
+                with ThreadPoolExecutor(max_workers=4) as pool:
+                    futures = {pool.submit(_run_readonly_query, db_file, sql): key for key, sql in queries.items()}
+                    results = {key: future.result() for future, key in futures.items()}
+            else:
+                # Each conn.execute returns its own cursor; rows are consumed lazily below
+                results = {key: conn.execute(sql) for key, sql in queries.items()}
+
+            integrity = next(iter(results["integrity"]))[0]
             if integrity == "ok":
                 print_success("Database integrity check passed")
                 analysis["valid"] = True
             else:
                 print_error(f"Database integrity check failed: {integrity}")
 
-            # Count ticks
-            cursor.execute("SELECT COUNT(*) FROM ticks;")
-            analysis["tick_count"] = cursor.fetchone()[0]
+            analysis["tick_count"], analysis["symbol_count"], first, last = next(iter(results["stats"]))
+            analysis["date_range"] = {"first": first, "last": last}
             print_info(f"Total ticks: {analysis['tick_count']:,}")
-
-            # Count symbols
-            cursor.execute("SELECT COUNT(DISTINCT symbol) FROM ticks;")
-            analysis["symbol_count"] = cursor.fetchone()[0]
             print_info(f"Symbols: {analysis['symbol_count']}")
-
-            # Get date range
-            cursor.execute("""
-                SELECT
-                    datetime(MIN(timestamp) / 1000, 'unixepoch') as first,
-                    datetime(MAX(timestamp) / 1000, 'unixepoch') as last
-                FROM ticks;
-            """)
-            first, last = cursor.fetchone()
-            analysis["date_range"] = {"first": first, "last": last}
             print_info(f"Date range: {first} to {last}")
 
-            # Get symbols
-            cursor.execute("SELECT DISTINCT symbol FROM ticks ORDER BY symbol;")
-            symbols = [row[0] for row in cursor.fetchall()]
-            print_info(f"Symbols in database: {', '.join(symbols[:10])}" + ("..." if len(symbols) > 10 else ""))
+            rows = iter(results["symbols"])
+            symbols = [row[0] for row in islice(rows, 10)]
+            more = next(rows, None) is not None
+            print_info(f"Symbols in database: {', '.join(symbols)}" + ("..." if more else ""))
 
             conn.close()
         except Exception as e:
@@ -299,40 +507,34 @@ class DatabaseRotationMonitor:
         """Test rotation script"""
         print_header("Database Rotation Test")
 
-        rotate_script = self.schema_dir / ("rotate_tick_db.ps1" if os.name == "nt" else "rotate_tick_db.sh")
-
-        if not rotate_script.exists():
-            print_error(f"Rotation script not found: {rotate_script}")
+        if not self.rotate_script.exists():
+            print_error(f"Rotation script not found: {self.rotate_script}")
             return False
 
         try:
-            if os.name == "nt":
+            if self.is_nt:
                 cmd = [
                     "powershell.exe",
                     "-NoProfile",
                     "-ExecutionPolicy", "Bypass",
-                    "-File", str(rotate_script),
+                    "-File", str(self.rotate_script),
                     "-Action", "rotate",
                 ]
                 if dry_run:
                     cmd.extend(["-DryRun"])
             else:
-                cmd = [str(rotate_script), "rotate"]
+                cmd = [str(self.rotate_script), "rotate"]
                 env = os.environ.copy()
                 env["DRY_RUN"] = "true" if dry_run else "false"
 
             print_info(f"Running: {' '.join(cmd)}")
-            result = subprocess.run(cmd, capture_output=True, text=True, env=env if os.name != "nt" else None)
+            returncode = _stream_command(cmd, env=env if not self.is_nt else None)
 
-            if result.returncode == 0:
+            if returncode == 0:
                 print_success("Rotation test passed")
-                if result.stdout:
-                    print(result.stdout)
                 return True
             else:
                 print_error("Rotation test failed")
-                if result.stderr:
-                    print(result.stderr)
                 return False
         except Exception as e:
             print_error(f"Failed to run rotation test: {e}")
@@ -342,30 +544,24 @@ class DatabaseRotationMonitor:
         """Test compression script"""
         print_header("Database Compression Test")
 
-        compress_script = self.schema_dir / "compress_old_dbs.sh"
-
-        if not compress_script.exists():
-            print_error(f"Compression script not found: {compress_script}")
+        if not self.compress_script.exists():
+            print_error(f"Compression script not found: {self.compress_script}")
             return False
 
         try:
             env = os.environ.copy()
             env["DRY_RUN"] = "true" if dry_run else "false"
 
-            cmd = [str(compress_script), "compress"]
+            cmd = [str(self.compress_script), "compress"]
             print_info(f"Running: {' '.join(cmd)} (DRY_RUN={env['DRY_RUN']})")
 
-            result = subprocess.run(cmd, capture_output=True, text=True, env=env)
+            returncode = _stream_command(cmd, env=env)
 
-            if result.returncode == 0:
+            if returncode == 0:
                 print_success("Compression test passed")
-                if result.stdout:
-                    print(result.stdout)
                 return True
             else:
                 print_error("Compression test failed")
-                if result.stderr:
-                    print(result.stderr)
                 return False
         except Exception as e:
             print_error(f"Failed to run compression test: {e}")
@@ -375,30 +571,7 @@ class DatabaseRotationMonitor:
         """Show retention policy summary"""
         print_header("6-Month Retention Policy")
 
-        print(f"{Colors.BOLD}Daily Rotation:{Colors.ENDC}")
-        print("  • Time: Midnight UTC (00:00)")
-        print("  • Action: Create new database for current day")
-        print("  • Previous day: Closed and backed up")
-        print()
-
-        print(f"{Colors.BOLD}Weekly Compression:{Colors.ENDC}")
-        print("  • Time: Sunday 02:00 UTC")
-        print("  • Threshold: Databases older than 7 days")
-        print("  • Method: zstd compression level 19")
-        print("  • Compression ratio: Typically 4-5x")
-        print()
-
-        print(f"{Colors.BOLD}Monthly Archival:{Colors.ENDC}")
-        print("  • Time: 1st of month at 03:00 UTC")
-        print("  • Threshold: Databases older than 30 days")
-        print("  • Action: Archive to cold storage")
-        print()
-
-        print(f"{Colors.BOLD}Retention Timeline:{Colors.ENDC}")
-        print("  • 0-7 days:   Active (uncompressed) - Hot tier")
-        print("  • 7-30 days:  Compressed - Warm tier")
-        print("  • 30-180 days: Archived - Cold tier")
-        print("  • 180+ days:  Deleted")
+        sys.stdout.write(RETENTION_POLICY)
 
 def main():
     """Main entry point"""
@@ -413,8 +586,14 @@ Examples:
   # Show database inventory
   python automation_monitor.py inventory
 
+  # Show database inventory with per-database tick counts
+  python automation_monitor.py inventory --counts
+
   # Analyze specific database
-  python automation_monitor.py analyze data/ticks/db/2026/01/ticks_2026-01-20.db
+  python automation_monitor.py analyze --db-path data/ticks/db/2026/01/ticks_2026-01-20.db
+
+  # Analyze with a full page-by-page integrity check
+  python automation_monitor.py analyze --db-path data/ticks/db/2026/01/ticks_2026-01-20.db --deep
 
   # Test rotation (dry run)
   python automation_monitor.py test-rotation --dry-run
@@ -444,6 +623,18 @@ Examples:
         help="Database path (for analyze command)"
     )
 
+    parser.add_argument(
+        "--counts",
+        action="store_true",
+        help="Count ticks in each listed database (for inventory command)"
+    )
+
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="Run full PRAGMA integrity_check (for analyze command)"
+    )
+
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -460,12 +651,12 @@ Examples:
         monitor.check_system_status()
         monitor.show_rotation_status()
     elif args.command == "inventory":
-        monitor.get_database_inventory()
+        monitor.get_database_inventory(counts=args.counts)
     elif args.command == "analyze":
         if not args.db_path:
             print_error("Database path required for analyze command")
             sys.exit(1)
-        monitor.analyze_database(args.db_path)
+        monitor.analyze_database(args.db_path, deep=args.deep)
     elif args.command == "test-rotation":
         success = monitor.run_rotation_test(dry_run=args.dry_run or True)
         sys.exit(0 if success else 1)
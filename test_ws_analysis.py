@@ -5,20 +5,26 @@ Analyzes ticks from ws://localhost:7999/ws to determine if they are real or simu
 """
 
 import asyncio
-import json
+import numpy as np
+import orjson
 import websockets
 import sys
 from datetime import datetime
 from collections import defaultdict
-from statistics import mean, stdev
 
 # Configuration
 WS_URL = "ws://localhost:7999/ws"
 CAPTURE_COUNT = 20
 TIMEOUT = 30
 
-# Data collection
-captured_ticks = defaultdict(list)
+# Data collection: per-symbol columns preallocated to CAPTURE_COUNT, 'n' = rows filled
+captured_ticks = defaultdict(lambda: {
+    'bid': np.empty(CAPTURE_COUNT),
+    'ask': np.empty(CAPTURE_COUNT),
+    'ts': np.empty(CAPTURE_COUNT),
+    'lp': [None] * CAPTURE_COUNT,
+    'n': 0,
+})
 total_tick_count = 0
 start_time = datetime.now()
 
@@ -29,19 +35,21 @@ analysis = {
     'evidence': []
 }
 
-def analyze_lp(ticks):
+def analyze_lp(captured):
     """Analyze LP sources"""
     print('\n📊 LP SOURCE ANALYSIS:')
     print('═' * 60)
 
     lp_counts = {}
-    for tick in ticks:
-        lp = tick.get('lp', 'UNKNOWN')
-        lp_counts[lp] = lp_counts.get(lp, 0) + 1
-        analysis['lp_sources'].add(lp)
+    total = 0
+    for cols in captured.values():
+        for lp in cols['lp'][:cols['n']]:
+            lp_counts[lp] = lp_counts.get(lp, 0) + 1
+        total += cols['n']
+    analysis['lp_sources'].update(lp_counts)
 
     for lp, count in lp_counts.items():
-        percentage = (count / len(ticks)) * 100
+        percentage = (count / total) * 100
         print(f"  {lp}: {count} ticks ({percentage:.1f}%)")
 
         if lp == 'SIMULATED':
@@ -49,28 +57,23 @@ def analyze_lp(ticks):
         elif lp == 'YOFX':
             analysis['evidence'].append('✅ LP field shows "YOFX" - indicates real FIX gateway data')
 
-def analyze_price_patterns(ticks):
+def analyze_price_patterns(captured):
     """Analyze price movement patterns"""
     print('\n📈 PRICE PATTERN ANALYSIS:')
     print('═' * 60)
 
-    by_symbol = defaultdict(list)
-    for tick in ticks:
-        by_symbol[tick['symbol']].append(tick)
-
-    for symbol, symbol_ticks in by_symbol.items():
-        if len(symbol_ticks) < 3:
+    for symbol, cols in captured.items():
+        if cols['n'] < 3:
             continue
 
         # Calculate price changes
-        price_changes = []
-        for i in range(1, len(symbol_ticks)):
-            change = symbol_ticks[i]['bid'] - symbol_ticks[i-1]['bid']
-            price_changes.append(change)
+        bids = cols['bid'][:cols['n']]
+        price_changes = np.diff(bids)
 
         # Check for regular patterns
-        unique_changes = len(set(round(c, 6) for c in price_changes))
-        regularity_ratio = unique_changes / len(price_changes) if price_changes else 0
+        q = np.rint(price_changes * 1_000_000).astype(np.int64)
+        unique_changes = np.unique(q).size
+        regularity_ratio = unique_changes / len(price_changes) if price_changes.size else 0
 
         print(f"  {symbol}:")
         print(f"    - Price changes: {len(price_changes)}")
@@ -83,23 +86,29 @@ def analyze_price_patterns(ticks):
             analysis['evidence'].append(f"✅ {symbol}: High price variation ({regularity_ratio:.3f}) suggests real market data")
 
         # Sample changes
-        sample_changes = [f"{c:.6f}" for c in price_changes[:5]]
+        sample_changes = [f"{c:.6f}" for c in price_changes[:5].tolist()]
         print(f"    - Sample changes: [{', '.join(sample_changes)}]")
 
-def analyze_timestamps(ticks):
+def analyze_timestamps(captured):
     """Analyze timestamp patterns"""
     print('\n⏰ TIMESTAMP ANALYSIS:')
     print('═' * 60)
 
-    timestamps = sorted([t['timestamp'] for t in ticks])
-    gaps = [timestamps[i] - timestamps[i-1] for i in range(1, len(timestamps))]
+    timestamps = np.concatenate([cols['ts'][:cols['n']] for cols in captured.values()])
+    gaps = np.diff(timestamps)
+    # Columns are concatenated symbol by symbol; sorting is skipped only when that
+    # concatenation is already non-decreasing (no negative gap)
+    if (gaps < 0).any():
+        timestamps.sort()
+        gaps = np.diff(timestamps)
 
-    if not gaps:
+    if not gaps.size:
         print("  Not enough data for timestamp analysis")
         return
 
-    avg_gap = mean(gaps)
-    unique_gaps = len(set(gaps))
+    avg_gap = gaps.mean()
+    # Quantize to milliseconds so float noise doesn't count as a distinct gap
+    unique_gaps = np.unique(np.rint(gaps * 1000).astype(np.int64)).size
     gap_regularity = unique_gaps / len(gaps)
 
     print(f"  Average gap: {avg_gap:.2f}s")
@@ -113,25 +122,25 @@ def analyze_timestamps(ticks):
         analysis['evidence'].append("✅ Irregular timestamp intervals suggest real market data")
 
     # Sample gaps
-    sample_gaps = [f"{g:.2f}" for g in gaps[:10]]
+    sample_gaps = [f"{g:.2f}" for g in gaps[:10].tolist()]
     print(f"  Sample gaps (s): [{', '.join(sample_gaps)}]")
 
-def analyze_spread(ticks):
+def analyze_spread(captured):
     """Analyze spread consistency"""
     print('\n💰 SPREAD ANALYSIS:')
     print('═' * 60)
 
-    by_symbol = defaultdict(list)
-    for tick in ticks:
-        by_symbol[tick['symbol']].append(tick)
-
-    for symbol, symbol_ticks in by_symbol.items():
-        spreads = [round(t['ask'] - t['bid'], 6) for t in symbol_ticks]
-        unique_spreads = len(set(spreads))
-        spread_consistency = 1 - (unique_spreads / len(spreads))
+    for symbol, cols in captured.items():
+        n = cols['n']
+        bids = cols['bid'][:n]
+        asks = cols['ask'][:n]
+        q = np.rint((asks - bids) * 1_000_000).astype(np.int64)
+        spreads = np.unique(q)
+        unique_spreads = spreads.size
+        spread_consistency = 1 - (unique_spreads / n)
 
         print(f"  {symbol}:")
-        print(f"    - Total ticks: {len(spreads)}")
+        print(f"    - Total ticks: {n}")
         print(f"    - Unique spreads: {unique_spreads}")
         print(f"    - Consistency: {spread_consistency * 100:.1f}%")
 
@@ -141,7 +150,7 @@ def analyze_spread(ticks):
             analysis['evidence'].append(f"✅ {symbol}: Variable spread suggests real market conditions")
 
         # Sample spreads
-        sample_spreads = [f"{s:.6f}" for s in list(set(spreads))[:5]]
+        sample_spreads = [f"{s / 1_000_000:.6f}" for s in spreads[:5].tolist()]
         print(f"    - Sample spreads: [{', '.join(sample_spreads)}]")
 
 def generate_verdict():
@@ -189,9 +198,50 @@ def generate_verdict():
     print(f"Duration: {duration:.1f}s")
     print('═' * 60)
 
+async def receive_frames(websocket, queue):
+    """Producer: drain the socket into the queue so recv() never waits on decoding"""
+    while True:
+        await queue.put(await websocket.recv())
+
+async def process_frames(queue):
+    """Consumer: decode and store ticks until enough data is captured"""
+    global total_tick_count
+
+    while True:
+        message = await queue.get()
+        try:
+            tick = orjson.loads(message)
+        except orjson.JSONDecodeError as e:
+            print(f"Error parsing tick: {e}")
+            continue
+
+        if tick.get('type') == 'tick':
+            total_tick_count += 1
+            symbol = tick['symbol']
+            analysis['symbols'].add(symbol)
+
+            # Store tick
+            cols = captured_ticks[symbol]
+            n = cols['n']
+            if n < CAPTURE_COUNT:
+                cols['bid'][n] = tick['bid']
+                cols['ask'][n] = tick['ask']
+                cols['ts'][n] = tick['timestamp']
+                cols['lp'][n] = tick.get('lp', 'UNKNOWN')
+                cols['n'] = n + 1
+
+            # Log first few ticks
+            if total_tick_count <= 5:
+                timestamp = datetime.fromtimestamp(tick['timestamp']).isoformat()
+                print(f"[{total_tick_count}] {symbol} | Bid: {tick['bid']:.5f} | Ask: {tick['ask']:.5f} | LP: {tick.get('lp', 'N/A')} | Time: {timestamp}")
+
+            # Check if we have enough data
+            symbols_with_enough = sum(1 for cols in captured_ticks.values() if cols['n'] >= CAPTURE_COUNT)
+            if symbols_with_enough >= min(3, len(analysis['symbols'])) and total_tick_count >= CAPTURE_COUNT:
+                return
+
 async def capture_and_analyze():
     """Main capture and analysis function"""
-    global total_tick_count
 
     print('═' * 60)
     print('🔌 WebSocket Quote Analysis Tool')
@@ -206,43 +256,21 @@ async def capture_and_analyze():
             print('✅ Connected to WebSocket')
             print('📊 Capturing ticks...\n')
 
-            start = datetime.now()
-
-            while True:
-                # Check timeout
-                if (datetime.now() - start).total_seconds() > TIMEOUT:
-                    print('\n⏰ Analysis timeout reached')
-                    break
-
-                try:
-                    # Receive message with timeout
-                    message = await asyncio.wait_for(websocket.recv(), timeout=5.0)
-                    tick = json.loads(message)
+            queue = asyncio.Queue(maxsize=4096)
+            producer = asyncio.create_task(receive_frames(websocket, queue))
+            consumer = asyncio.create_task(process_frames(queue))
 
-                    if tick.get('type') == 'tick':
-                        total_tick_count += 1
-                        symbol = tick['symbol']
-                        analysis['symbols'].add(symbol)
+            done, _ = await asyncio.wait({producer, consumer}, timeout=TIMEOUT, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                print('\n⏰ Analysis timeout reached')
 
-                        # Store tick
-                        if len(captured_ticks[symbol]) < CAPTURE_COUNT:
-                            captured_ticks[symbol].append(tick)
+            producer.cancel()
+            consumer.cancel()
+            await asyncio.gather(producer, consumer, return_exceptions=True)
 
-                        # Log first few ticks
-                        if total_tick_count <= 5:
-                            timestamp = datetime.fromtimestamp(tick['timestamp']).isoformat()
-                            print(f"[{total_tick_count}] {symbol} | Bid: {tick['bid']:.5f} | Ask: {tick['ask']:.5f} | LP: {tick.get('lp', 'N/A')} | Time: {timestamp}")
-
-                        # Check if we have enough data
-                        symbols_with_enough = sum(1 for ticks in captured_ticks.values() if len(ticks) >= CAPTURE_COUNT)
-                        if symbols_with_enough >= min(3, len(analysis['symbols'])) and total_tick_count >= CAPTURE_COUNT:
-                            break
-
-                except asyncio.TimeoutError:
-                    continue
-                except json.JSONDecodeError as e:
-                    print(f"Error parsing tick: {e}")
-                    continue
+            # Surface errors from either task (connection loss, malformed frames)
+            for task in done:
+                task.result()
 
     except Exception as e:
         print(f"❌ Connection error: {e}")
@@ -251,16 +279,14 @@ async def capture_and_analyze():
     print('\n🔌 WebSocket disconnected')
 
     # Perform analysis
-    all_ticks = [tick for ticks in captured_ticks.values() for tick in ticks]
-
-    if not all_ticks:
+    if not captured_ticks:
         print('\n❌ No ticks captured. Server may not be sending data.')
         sys.exit(1)
 
-    analyze_lp(all_ticks)
-    analyze_price_patterns(all_ticks)
-    analyze_timestamps(all_ticks)
-    analyze_spread(all_ticks)
+    analyze_lp(captured_ticks)
+    analyze_price_patterns(captured_ticks)
+    analyze_timestamps(captured_ticks)
+    analyze_spread(captured_ticks)
     generate_verdict()
 
 if __name__ == '__main__':